@@ -1,12 +1,61 @@
 """biocompute - Experiment definition and submission library."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from biocompute._version import __version__
-from biocompute.client import Client, SubmissionResult
-from biocompute.exceptions import BiocomputeError
-from biocompute.ops import FillOp, ImageOp, MixOp, Op
-from biocompute.reagent import Reagent, blue_dye, green_dye, red_dye, water
-from biocompute.trace import Trace, TracedOp
-from biocompute.well import Well, wells
+
+if TYPE_CHECKING:
+    from biocompute.client import Client, SubmissionResult
+    from biocompute.exceptions import BiocomputeError
+    from biocompute.ops import FillOp, ImageOp, MixOp, Op
+    from biocompute.reagent import Reagent, blue_dye, green_dye, red_dye, water
+    from biocompute.trace import Trace, TracedOp
+    from biocompute.well import Well, wells
+
+# Public name -> defining module. Resolved on first attribute access so
+# ``import biocompute`` doesn't pull in httpx until the client is needed.
+_LAZY: dict[str, str] = {
+    "Client": "biocompute.client",
+    "SubmissionResult": "biocompute.client",
+    "Well": "biocompute.well",
+    "wells": "biocompute.well",
+    "Trace": "biocompute.trace",
+    "TracedOp": "biocompute.trace",
+    "Op": "biocompute.ops",
+    "FillOp": "biocompute.ops",
+    "MixOp": "biocompute.ops",
+    "ImageOp": "biocompute.ops",
+    "Reagent": "biocompute.reagent",
+    "red_dye": "biocompute.reagent",
+    "green_dye": "biocompute.reagent",
+    "blue_dye": "biocompute.reagent",
+    "water": "biocompute.reagent",
+    "BiocomputeError": "biocompute.exceptions",
+}
+
+# Submodules reachable as attributes (``biocompute.client``) without an
+# explicit ``import biocompute.client``, as when __init__ imported them.
+_SUBMODULES = frozenset({"cli", "client", "exceptions", "ops", "reagent", "trace", "visualize", "well"})
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(module), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f"biocompute.{name}")
+    else:
+        raise AttributeError(f"module 'biocompute' has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "__version__",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import ast
 import importlib.util
 import sys
 import time
@@ -14,12 +15,12 @@ import httpx
 from biocompute.client import (
     CONFIG_FILE,
     DEFAULT_BASE_URL,
+    TERMINAL_STATUSES,
     Client,
     SubmissionResult,
     save_config,
 )
 from biocompute.exceptions import BiocomputeError
-from biocompute.visualize import render_cli
 
 
 def _subscribe(email: str) -> None:
@@ -92,13 +93,63 @@ def logout() -> None:
         click.echo("Not logged in.")
 
 
+# Script path -> ((st_mtime_ns, st_size), experiments), so a script that
+# hasn't changed isn't executed again within the same process.
+_experiments_cache: dict[Path, tuple[tuple[int, int], list[tuple[str, Any]]]] = {}
+
+# Builtins that can bind module globals the AST can't see, e.g.
+# ``globals()[f"experiment_{v}"] = _make(v)`` in a parameter sweep.
+_DYNAMIC_BINDERS = frozenset({"globals", "vars", "setattr", "exec", "eval", "__import__"})
+
+
+def _experiment_names(source: bytes) -> list[str] | None:
+    """Names the script binds to ``experiment*``, in source order.
+
+    Covers ``def``s as well as assignments and imports (e.g. experiments
+    built by a factory). Returns None when a star import or a dynamic
+    binder (``globals()``, ``setattr``, ``exec``...) makes the bound names
+    unknowable without running the script.
+    """
+    bound: list[tuple[int, int, str]] = []
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            bound.append((node.lineno, node.col_offset, node.name))
+        elif isinstance(node, ast.Name):
+            if node.id in _DYNAMIC_BINDERS:
+                return None
+            if isinstance(node.ctx, ast.Store):
+                bound.append((node.lineno, node.col_offset, node.id))
+        elif isinstance(node, ast.Attribute) and node.attr == "__dict__":
+            return None
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                if alias.name == "*":
+                    return None
+                name = alias.asname or alias.name.split(".")[0]
+                bound.append((node.lineno, node.col_offset, name))
+    bound.sort()
+    return list(dict.fromkeys(name for _, _, name in bound if name.startswith("experiment")))
+
 
 def _find_experiments(path: Path) -> list[tuple[str, Any]]:
     """Discover experiment functions in a user script.
 
-    Returns (name, callable) pairs for every top-level function whose name
-    starts with ``experiment``, in definition order.
+    Returns (name, callable) pairs for every module-level callable whose
+    name starts with ``experiment``, in the order the script binds them.
+    The source is parsed first, so a script that can't define any is
+    never executed.
     """
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _experiments_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return list(cached[1])
+
+    names = _experiment_names(path.read_bytes())
+    if names == []:
+        _experiments_cache[path] = (key, [])
+        return []
+
     spec = importlib.util.spec_from_file_location("_user_experiment", path)
     if spec is None or spec.loader is None:
         click.echo(f"Cannot load {path}", err=True)
@@ -108,13 +159,14 @@ def _find_experiments(path: Path) -> list[tuple[str, Any]]:
 
     experiments: list[tuple[str, Any]] = []
     for name in dir(module):
-        if name.startswith("experiment") and callable(getattr(module, name)):
-            experiments.append((name, getattr(module, name)))
-    # Sort by source line number so order matches the file.
-    import inspect
-
-    experiments.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
-    return experiments
+        fn = getattr(module, name)
+        if name.startswith("experiment") and callable(fn):
+            experiments.append((name, fn))
+    # Source order where the AST knows it; names from star imports go last.
+    order = {name: i for i, name in enumerate(names or [])}
+    experiments.sort(key=lambda pair: order.get(pair[0], len(order)))
+    _experiments_cache[path] = (key, experiments)
+    return list(experiments)
 
 
 @cli.command()
@@ -136,8 +188,9 @@ def submit(file: str, follow: bool) -> None:
     client = _get_client()
     failed = False
     try:
-        for exp_name, fn in experiments:
-            job = client.submit_async(fn)
+        # Each job is reported as soon as it exists, before the next POST.
+        jobs = client._iter_submit_async([fn for _, fn in experiments])
+        for (exp_name, _), job in zip(experiments, jobs, strict=True):
             job_id = job["id"]
 
             if not follow:
@@ -169,56 +222,93 @@ def submit(file: str, follow: bool) -> None:
         sys.exit(1)
 
 
+_SPINNER_FRAMES = tuple(click.style(c, fg="cyan") for c in "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏")
+# Fully rendered spinner lines per label, so each tick is a lookup.
+_SPINNER_LINES = {
+    label: tuple(f"\r  {frame} {label}...  " for frame in _SPINNER_FRAMES) for label in ("Queued", "Running")
+}
+
+
+_STATUS_LINES = {
+    status: f"  {click.style(msg, dim=True)}"
+    for status, msg in {
+        "queued": "Waiting in queue for an available worker",
+        "running": "Experiment is executing on the worker",
+        "complete": "Complete",
+        "failed": "Failed",
+        "unknown": "Unknown",
+    }.items()
+}
+
+
 def _poll_with_status(client: Client, job_id: str, experiment_name: str) -> SubmissionResult:
-    """Poll for job completion, printing status transitions."""
-    delay = 0.15
+    """Poll for job completion, printing status transitions.
+
+    The spinner redraws every tick; the server is polled densely for the
+    first couple of seconds and on a jittered backoff after that, unless
+    the server sends a Retry-After hint. When stdout isn't a terminal only
+    the status lines are written, so logs don't fill with spinner frames.
+    """
+    animate = sys.stdout.isatty()
+    tick = 0.15
+    dense_period = 2.0
     last_status = ""
     start = time.monotonic()
+    next_poll_at = start
+    delays = client._poll_delays()
     timeout = client._timeout
-    spinner_chars = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+    deadline = start + timeout
     spinner_idx = 0
 
-    status_messages = {
-        "queued": "Waiting in queue for an available worker",
-        "running": "Experiment is executing on the worker",
-    }
-
     while True:
-        elapsed = time.monotonic() - start
-        if elapsed > timeout:
-            click.echo("")
-            raise BiocomputeError(f"Job did not complete within {timeout}s")
-
-        data = client.get_job(job_id)
-        status = data.get("status", "unknown")
-
-        if status != last_status:
-            if last_status:
-                click.echo("\r" + " " * 40 + "\r", nl=False)
-            msg = status_messages.get(status, status.capitalize())
-            click.echo(f"  {click.style(msg, dim=True)}")
-            last_status = status
-
-        if status in ("complete", "failed"):
-            click.echo("\r" + " " * 40 + "\r", nl=False)
-            result = SubmissionResult.from_job_data(data)
-
-            if status == "complete":
-                check = click.style("✔", fg="green", bold=True)
-                name_styled = click.style(experiment_name, fg="blue", bold=True)
-                results_cmd = click.style(f"biocompute show {job_id}", fg="green", bold=True)
-                click.echo(f"  {check} {name_styled} completed. View results: {results_cmd}")
-                _print_well_images(result)
-
-            return result
-
-        spinner = click.style(spinner_chars[spinner_idx], fg="cyan")
-        label = "Queued" if status == "queued" else "Running"
-        click.echo(f"\r  {spinner} {label}...  ", nl=False)
+        now = time.monotonic()
+        if now >= next_poll_at:
+            data = client.get_job(job_id)
+            status = data.get("status", "unknown")
+
+            if status != last_status:
+                if last_status and animate:
+                    click.echo("\r" + " " * 40 + "\r", nl=False)
+                line = _STATUS_LINES.get(status) or f"  {click.style(status.capitalize(), dim=True)}"
+                click.echo(line)
+                last_status = status
+
+            if status in TERMINAL_STATUSES:
+                if animate:
+                    click.echo("\r" + " " * 40 + "\r", nl=False)
+                result = SubmissionResult.from_job_data(data)
+
+                if status == "complete":
+                    check = click.style("✔", fg="green", bold=True)
+                    name_styled = click.style(experiment_name, fg="blue", bold=True)
+                    results_cmd = click.style(f"biocompute show {job_id}", fg="green", bold=True)
+                    click.echo(f"  {check} {name_styled} completed. View results: {results_cmd}")
+                    _print_well_images(result)
+
+                return result
+
+            now = time.monotonic()
+            if now >= deadline:
+                if animate:
+                    click.echo("")
+                raise BiocomputeError(f"Job did not complete within {timeout}s")
+
+            wait = client._retry_hint(job_id)
+            if wait is None:
+                wait = tick if now - start < dense_period else next(delays)
+            # Never wait past the deadline: the last poll lands on it.
+            next_poll_at = min(now + wait, deadline)
+
+        if not animate:
+            time.sleep(max(0.0, next_poll_at - time.monotonic()))
+            continue
+
+        frames = _SPINNER_LINES["Queued" if last_status == "queued" else "Running"]
+        click.echo(frames[spinner_idx], nl=False)
         sys.stdout.flush()
-        spinner_idx = (spinner_idx + 1) % len(spinner_chars)
+        spinner_idx = (spinner_idx + 1) % len(frames)
 
-        time.sleep(delay)
+        time.sleep(tick)
 
 
 def _print_well_images(result: SubmissionResult) -> None:
@@ -241,7 +331,7 @@ def visualize(file: str) -> None:
     """
     from biocompute.client import _to_experiments
     from biocompute.trace import collect_trace
-    from biocompute.visualize import build_slides_from_experiments
+    from biocompute.visualize import build_slides_from_experiments, render_cli
 
     path = Path(file).resolve()
     experiments = _find_experiments(path)
@@ -272,12 +362,12 @@ def jobs() -> None:
         id_width = max(len("Job ID"), *(len(r[0]) for r in rows))
         st_width = max(len("Status"), *(len(r[1]) for r in rows))
 
-        header = f"  {'Job ID':<{id_width}}  {'Status':<{st_width}}"
-        separator = f"  {'─' * id_width}  {'─' * st_width}"
-        click.echo(header)
-        click.echo(separator)
-        for job_id, status in rows:
-            click.echo(f"  {job_id:<{id_width}}  {status:<{st_width}}")
+        lines = [
+            f"  {'Job ID':<{id_width}}  {'Status':<{st_width}}",
+            f"  {'─' * id_width}  {'─' * st_width}",
+        ]
+        lines.extend(f"  {job_id:<{id_width}}  {status:<{st_width}}" for job_id, status in rows)
+        click.echo("\n".join(lines))
     except BiocomputeError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
@@ -296,7 +386,7 @@ def show(job_id: str, follow: bool) -> None:
 
         if follow:
             status = job.get("status", "unknown")
-            if status in ("complete", "failed"):
+            if status in TERMINAL_STATUSES:
                 click.echo(f"Job already {status}.")
                 if status == "complete":
                     _print_well_images(SubmissionResult.from_job_data(job))
@@ -326,10 +416,12 @@ def leaderboard() -> None:
         if not entries:
             click.echo("Leaderboard is empty.")
             return
-        for i, entry in enumerate(entries, 1):
-            name = entry.get("user_name", "?")
-            score = entry.get("best_score", "?")
-            click.echo(f"  {i}. {name}  score={score}")
+        click.echo(
+            "\n".join(
+                f"  {i}. {entry.get('user_name', '?')}  score={entry.get('best_score', '?')}"
+                for i, entry in enumerate(entries, 1)
+            )
+        )
     except BiocomputeError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
@@ -2,38 +2,100 @@
 
 from __future__ import annotations
 
+import atexit
 import base64
+import email.utils
+import json
 import os
+import random
+import sys
+import threading
 import time
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
 import httpx
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, see the "fast" extra
+    orjson = None  # type: ignore[assignment]
+
 from biocompute.exceptions import BiocomputeError
-from biocompute.ops import op_to_dict
-from biocompute.trace import TracedOp, collect_trace
+
+if TYPE_CHECKING:
+    from biocompute.trace import TracedOp
 
 CONFIG_FILE = Path.home() / ".biocompute" / "config.toml"
 IMAGES_DIR = Path.home() / ".biocompute" / "images"
 DEFAULT_BASE_URL = os.environ.get("BIOCOMPUTE_BASE_URL", "https://biocompute-job-server.fly.dev")
 
+POLL_BASE_DELAY = 0.2
+POLL_BACKOFF_FACTOR = 1.3
+POLL_MAX_DELAY = 3.0
+ENROLLMENT_TTL = 60.0
+LEADERBOARD_TTL = 15.0
+TERMINAL_STATUSES = frozenset({"complete", "failed"})
+
+
+# (path, st_mtime_ns, st_size) -> parsed config, so repeated Client()
+# construction doesn't re-read an unchanged file.
+_config_cache: tuple[tuple[Path, int, int], dict[str, str]] | None = None
+
 
 def save_config(config: dict[str, str]) -> None:
     """Save config to ~/.biocompute/config.toml."""
+    global _config_cache
     CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    lines = [f'{k} = "{v}"' for k, v in config.items()]
-    CONFIG_FILE.write_text("\n".join(lines) + "\n")
+    lines = [f"{k} = {_toml_string(v)}" for k, v in config.items()]
+    CONFIG_FILE.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    _config_cache = None
+
+
+def _toml_string(value: str) -> str:
+    """Quote *value* as a TOML basic string.
+
+    JSON's escapes for quotes, backslashes and control characters are valid
+    TOML, but its surrogate-pair escapes for non-BMP characters are not, so
+    non-ASCII is written literally; DEL is the one printable-range character
+    TOML still requires escaped.
+    """
+    return json.dumps(value, ensure_ascii=False).replace("\x7f", "\\u007f")
 
 
 def _load_config() -> dict[str, str]:
     """Load config from ~/.biocompute/config.toml."""
-    if not CONFIG_FILE.exists():
+    global _config_cache
+    try:
+        st = CONFIG_FILE.stat()
+    except FileNotFoundError:
         return {}
+    key = (CONFIG_FILE, st.st_mtime_ns, st.st_size)
+    if _config_cache is not None and _config_cache[0] == key:
+        return dict(_config_cache[1])
+    text = CONFIG_FILE.read_text(encoding="utf-8")
+    try:
+        config = {k: str(v) for k, v in tomllib.loads(text).items()}
+    except tomllib.TOMLDecodeError:
+        # Older releases wrote values unescaped, which isn't always valid
+        # TOML (e.g. a backslash in a value); read those the way they did.
+        config = _parse_legacy_config(text)
+    _config_cache = (key, config)
+    return dict(config)
+
+
+def _parse_legacy_config(text: str) -> dict[str, str]:
+    """Parse ``key = "value"`` lines as written by older releases."""
     config: dict[str, str] = {}
-    for line in CONFIG_FILE.read_text().splitlines():
+    for line in text.splitlines():
         line = line.strip()
         if not line or line.startswith("#"):
             continue
@@ -43,6 +105,66 @@ def _load_config() -> dict[str, str]:
     return config
 
 
+def _poll_delays(initial: float, factor: float, cap: float) -> Iterator[float]:
+    """Yield the waits between status polls: jittered exponential backoff.
+
+    Grows from *initial* by *factor* per poll up to *cap*, each value
+    scaled by a random factor in [0.5, 1.5) so many clients don't poll
+    in lockstep.
+    """
+    delay = initial
+    while True:
+        yield delay * random.uniform(0.5, 1.5)
+        delay = min(delay * factor, cap)
+
+
+def _parse_retry_after(value: object) -> float | None:
+    """Seconds from a Retry-After value: delta-seconds or an HTTP-date."""
+    if isinstance(value, (int, float)):
+        return max(0.0, float(value))
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Encode *obj* as compact UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _iter_job_body(experiments: list[list[dict[str, Any]]]) -> Iterator[bytes]:
+    """Yield the JSON body for ``POST /api/v1/jobs`` one well at a time.
+
+    Streaming the body means a large experiment is never held as a second,
+    fully serialized copy alongside its ops.
+    """
+    yield b'{"experiments":['
+    for i, experiment in enumerate(experiments):
+        if i:
+            yield b","
+        yield _json_bytes(experiment)
+    yield b"]}"
+
+
+def _json_loads(content: bytes) -> Any:
+    """Decode a JSON response body, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 def _decode_data_uri(data_uri: str) -> bytes:
     """Strip a data:image/png;base64,... prefix and return raw bytes."""
     if "," in data_uri:
@@ -50,7 +172,7 @@ def _decode_data_uri(data_uri: str) -> bytes:
     return base64.b64decode(data_uri)
 
 
-@dataclass
+@dataclass(slots=True)
 class SubmissionResult:
     """Result of a protocol submission."""
 
@@ -118,6 +240,15 @@ class Client:
 
         client = Client(api_key="sk_...", base_url="https://...")
         result = client.submit(my_experiment)
+
+    Pass ``long_poll=25.0`` to have the server hold each status request
+    open until the job changes state, instead of polling on a schedule.
+    ``prewarm=True`` opens the connection in the background on construction.
+
+    Job status is polled after ``poll_delay`` seconds, growing by
+    ``poll_backoff`` per poll up to ``poll_max_delay`` (each with jitter).
+    The defaults (0.2 s, x1.3, 3 s) notice short jobs quickly; raise the
+    cap to send fewer requests for long ones.
     """
 
     def __init__(
@@ -126,11 +257,23 @@ class Client:
         *,
         base_url: str | None = None,
         timeout: float = 300.0,
+        long_poll: float | None = None,
+        prewarm: bool = False,
+        poll_delay: float = POLL_BASE_DELAY,
+        poll_backoff: float = POLL_BACKOFF_FACTOR,
+        poll_max_delay: float = POLL_MAX_DELAY,
     ) -> None:
-        config = _load_config() if (api_key is None or base_url is None) else {}
-
-        api_key = api_key or config.get("api_key", "")
-        base_url = base_url or config.get("base_url", "") or DEFAULT_BASE_URL
+        if poll_delay <= 0:
+            raise ValueError(f"poll_delay must be positive, got {poll_delay}")
+        if poll_backoff < 1:
+            raise ValueError(f"poll_backoff must be at least 1, got {poll_backoff}")
+        if poll_max_delay < poll_delay:
+            raise ValueError(f"poll_max_delay ({poll_max_delay}) must not be less than poll_delay ({poll_delay})")
+
+        if api_key is None or base_url is None:
+            config = _load_config()
+            api_key = api_key or config.get("api_key", "")
+            base_url = base_url or config.get("base_url", "") or DEFAULT_BASE_URL
 
         if not api_key or not base_url:
             raise BiocomputeError(
@@ -140,15 +283,45 @@ class Client:
 
         self._api_key = api_key
         self._base_url = base_url.rstrip("/")
+        self._jobs_url = f"{self._base_url}/api/v1/jobs"
         self._timeout = timeout
-        self._client = httpx.Client(
-            headers={"Authorization": f"Bearer {api_key}"},
-            timeout=30.0,
-        )
+        self._long_poll = long_poll
+        self._poll_delay = poll_delay
+        self._poll_backoff = poll_backoff
+        self._poll_max_delay = poll_max_delay
+        self._enrollment: dict[str, Any] | None = None
+        self._enrollment_fetched_at = 0.0
+        # (fetched_at, ETag, entries) for the last leaderboard response.
+        self._leaderboard: tuple[float, str | None, list[dict[str, Any]]] | None = None
+        # Job ID -> (ETag, response) for jobs that haven't finished yet.
+        self._job_etags: dict[str, tuple[str, dict[str, Any]]] = {}
+        # Job ID -> seconds the server asked us to wait before the next poll.
+        self._retry_after: dict[str, float] = {}
+        self._client = _acquire_http_client(self._base_url, api_key)
+        self._closed = False
+        self._prewarm_thread: threading.Thread | None = None
+        if prewarm:
+            self._prewarm_thread = threading.Thread(target=self._prewarm, daemon=True)
+            self._prewarm_thread.start()
+
+    def _prewarm(self) -> None:
+        """Open the pooled connection so the first real request skips DNS/TLS setup."""
+        try:
+            self._client.head(self._base_url)
+        except (httpx.HTTPError, RuntimeError):
+            # RuntimeError: the client was closed before the prewarm ran.
+            pass
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
+        """Release the client.
+
+        The underlying connection pool is shared by every ``Client`` with
+        the same server and API key; it is closed when the last of them
+        is closed, or at interpreter exit.
+        """
+        if not self._closed:
+            self._closed = True
+            _release_http_client(self._base_url, self._api_key)
 
     def __enter__(self) -> Client:
         return self
@@ -159,8 +332,7 @@ class Client:
     def user(self) -> dict[str, Any]:
         """Get the authenticated user's info."""
         resp = self._client.get(f"{self._base_url}/api/v1/user")
-        _check(resp)
-        data: dict[str, Any] = resp.json()
+        data: dict[str, Any] = _response_json(resp)
         return data
 
     def submit(self, fn: Callable[[], None]) -> SubmissionResult:
@@ -172,8 +344,27 @@ class Client:
         Returns:
             SubmissionResult with job data.
         """
-        job_data = self.submit_async(fn)
-        return self._poll(job_data["id"])
+        return self._finish(self.submit_async(fn))
+
+    def submit_many(self, fns: list[Callable[[], None]], *, max_workers: int = 8) -> list[SubmissionResult]:
+        """Submit several experiments and wait for all of them.
+
+        Jobs are created with ``submit_async_many()`` and then polled
+        concurrently, so the wait is bounded by the slowest job rather
+        than the sum of all of them.
+
+        Args:
+            fns: Callables that define well operations.
+            max_workers: Maximum number of jobs polled at once.
+
+        Returns:
+            SubmissionResults in the order of *fns*.
+        """
+        jobs = self.submit_async_many(fns)
+        if not jobs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as pool:
+            return list(pool.map(self._finish, jobs))
 
     def submit_async(self, fn: Callable[[], None]) -> dict[str, Any]:
         """Submit an experiment and return the job data without polling.
@@ -184,21 +375,22 @@ class Client:
         Returns:
             Job data dict from the server.
         """
-        trace = collect_trace(fn)
-        if not trace.ops:
-            raise BiocomputeError("Experiment has no operations. Call well.fill(), well.mix(), etc. in the experiment function.")
+        return self._post_job(_trace_experiments(fn))
 
-        experiments = _to_experiments(trace.ops)
+    def submit_async_many(self, fns: list[Callable[[], None]]) -> list[dict[str, Any]]:
+        """Submit several experiments, one job each, without polling.
 
-        resp = self._client.post(
-            f"{self._base_url}/api/v1/jobs",
-            json={
-                "experiments": experiments,
-            },
-        )
-        _check(resp)
-        data: dict[str, Any] = resp.json()
-        return data
+        Every function is traced before anything is sent, so an invalid
+        experiment fails the whole batch instead of leaving earlier jobs
+        submitted. The jobs are then posted over the same connection.
+
+        Args:
+            fns: Callables that define well operations.
+
+        Returns:
+            Job data dicts from the server, in the order of *fns*.
+        """
+        return list(self._iter_submit_async(fns))
 
     def list_jobs(self) -> list[dict[str, Any]]:
         """List all jobs for this challenge.
@@ -206,32 +398,60 @@ class Client:
         Returns:
             List of job summaries from the server.
         """
-        resp = self._client.get(f"{self._base_url}/api/v1/jobs")
-        _check(resp)
-        data: list[dict[str, Any]] = resp.json()
+        resp = self._client.get(self._jobs_url)
+        data: list[dict[str, Any]] = _response_json(resp)
         return data
 
-    def get_job(self, job_id: str) -> dict[str, Any]:
+    def get_job(self, job_id: str, *, wait: float | None = None) -> dict[str, Any]:
         """Get details for a single job.
 
+        While a job is still running, its last response is kept with its
+        ``ETag`` and revalidated with ``If-None-Match``, so an unchanged job
+        costs the server a bodiless 304 instead of a full response. A
+        ``Retry-After`` header (or ``retry_after`` field) is remembered as
+        the wait before the next poll.
+
         Args:
             job_id: The job ID.
+            wait: Ask the server to hold the request open for up to this
+                many seconds until the job status changes (long-poll).
 
         Returns:
             Job details from the server.
         """
-        resp = self._client.get(f"{self._base_url}/api/v1/jobs/{job_id}")
-        _check(resp)
-        data: dict[str, Any] = resp.json()
+        cached = self._job_etags.get(job_id)
+        resp = self._client.get(
+            f"{self._jobs_url}/{job_id}",
+            params={"wait": wait} if wait is not None else None,
+            headers={"If-None-Match": cached[0]} if cached is not None else None,
+            timeout=wait + 30.0 if wait is not None else httpx.USE_CLIENT_DEFAULT,
+        )
+        if resp.status_code == 304 and cached is not None:
+            self._record_retry_after(job_id, resp.headers.get("Retry-After"))
+            return cached[1]
+        data: dict[str, Any] = _response_json(resp)
+        self._record_retry_after(job_id, resp.headers.get("Retry-After") or data.get("retry_after"))
+        etag = resp.headers.get("ETag")
+        if etag and data.get("status") not in TERMINAL_STATUSES:
+            self._job_etags[job_id] = (etag, data)
+        else:
+            self._job_etags.pop(job_id, None)
         return data
 
     def enrollment(self) -> dict[str, Any]:
-        """Get the authenticated user's active enrollment."""
+        """Get the authenticated user's active enrollment.
+
+        Cached on the client for ``ENROLLMENT_TTL`` seconds so that
+        ``target()`` and ``leaderboard()`` don't refetch it on every call.
+        """
+        if self._enrollment is not None and time.monotonic() - self._enrollment_fetched_at < ENROLLMENT_TTL:
+            return self._enrollment
         resp = self._client.get(
             f"{self._base_url}/api/v1/user/enrollment",
         )
-        _check(resp)
-        data: dict[str, Any] = resp.json()
+        data: dict[str, Any] = _response_json(resp)
+        self._enrollment = data
+        self._enrollment_fetched_at = time.monotonic()
         return data
 
     def target(self) -> str:
@@ -240,35 +460,171 @@ class Client:
         b64: str = data["target_image_base64"]
         return b64
 
+    def target_bytes(self) -> bytes:
+        """Get the decoded target image bytes for this challenge."""
+        return _decode_data_uri(self.target())
+
     def leaderboard(self) -> list[dict[str, Any]]:
-        """Get the public leaderboard for the user's active challenge."""
+        """Get the public leaderboard for the user's active challenge.
+
+        Cached for ``LEADERBOARD_TTL`` seconds; after that the cached copy is
+        revalidated with ``If-None-Match`` when the server sent an ``ETag``.
+        """
+        cached = self._leaderboard
+        if cached is not None and time.monotonic() - cached[0] < LEADERBOARD_TTL:
+            return cached[2]
         data = self.enrollment()
         challenge_id = data["challenge_id"]
         resp = self._client.get(
             f"{self._base_url}/api/v1/challenges/{challenge_id}/leaderboard",
+            headers={"If-None-Match": cached[1]} if cached is not None and cached[1] else None,
         )
-        _check(resp)
-        entries: list[dict[str, Any]] = resp.json()["entries"]
+        if resp.status_code == 304 and cached is not None:
+            self._leaderboard = (time.monotonic(), cached[1], cached[2])
+            return cached[2]
+        if resp.status_code in (401, 403, 404):
+            # The cached enrollment may be stale; refetch it next time.
+            self._enrollment = None
+            self._leaderboard = None
+        entries: list[dict[str, Any]] = _response_json(resp)["entries"]
+        self._leaderboard = (time.monotonic(), resp.headers.get("ETag"), entries)
         return entries
 
+    def _record_retry_after(self, job_id: str, value: object) -> None:
+        seconds = _parse_retry_after(value)
+        if seconds is None:
+            self._retry_after.pop(job_id, None)
+        else:
+            self._retry_after[job_id] = seconds
+
+    def _retry_hint(self, job_id: str) -> float | None:
+        """Server-suggested wait before polling *job_id* again, if any.
+
+        Clamped to [poll_delay, poll_max_delay] so a bad hint can neither
+        hammer the server nor stall the poll loop.
+        """
+        hint = self._retry_after.pop(job_id, None)
+        if hint is None:
+            return None
+        return min(max(hint, self._poll_delay), self._poll_max_delay)
+
+    def _poll_delays(self) -> Iterator[float]:
+        """Backoff schedule for polling one job with this client's settings."""
+        return _poll_delays(self._poll_delay, self._poll_backoff, self._poll_max_delay)
+
+    def _iter_submit_async(self, fns: list[Callable[[], None]]) -> Iterator[dict[str, Any]]:
+        """Trace every function up front, then yield each job as it is created.
+
+        Callers that report job IDs can show each one before the next POST,
+        so a failure part-way through doesn't hide jobs already created.
+        """
+        payloads = [_trace_experiments(fn) for fn in fns]
+        for experiments in payloads:
+            yield self._post_job(experiments)
+
+    def _post_job(self, experiments: list[list[dict[str, Any]]]) -> dict[str, Any]:
+        """Create a job from serialized experiments."""
+        resp = self._client.post(
+            self._jobs_url,
+            content=_iter_job_body(experiments),
+            headers={"Content-Type": "application/json"},
+        )
+        data: dict[str, Any] = _response_json(resp)
+        return data
+
+    def _finish(self, job_data: dict[str, Any]) -> SubmissionResult:
+        """Result for a just-created job, polling only if it isn't done yet."""
+        if job_data.get("status") in TERMINAL_STATUSES:
+            return SubmissionResult.from_job_data(job_data)
+        return self._poll(job_data["id"])
+
     def _poll(self, job_id: str) -> SubmissionResult:
-        """Poll for job completion with backoff (no output)."""
-        start = time.monotonic()
-        delay = 1.0
+        """Poll for job completion with backoff (no output).
+
+        With ``long_poll`` set, time the server spends holding a request
+        counts towards the delay, so a server that supports long-polling
+        is re-asked immediately while one that ignores it is still polled
+        on the normal backoff schedule. Sleeps and long-poll waits are
+        clipped to the overall deadline, so a timeout isn't overshot by a
+        full backoff step.
+        """
+        deadline = time.monotonic() + self._timeout
+        delays = self._poll_delays()
 
         while True:
-            elapsed = time.monotonic() - start
-            if elapsed > self._timeout:
-                raise BiocomputeError(f"Job did not complete within {self._timeout}s")
-
-            data = self.get_job(job_id)
+            requested_at = time.monotonic()
+            wait = self._long_poll
+            if wait is not None:
+                wait = min(wait, max(0.0, deadline - requested_at))
+            data = self.get_job(job_id, wait=wait)
             status = data.get("status", "unknown")
 
-            if status in ("complete", "failed"):
+            if status in TERMINAL_STATUSES:
                 return SubmissionResult.from_job_data(data)
 
-            time.sleep(delay)
-            delay = min(delay * 1.5, 10.0)
+            now = time.monotonic()
+            if now >= deadline:
+                raise BiocomputeError(f"Job did not complete within {self._timeout}s")
+
+            delay = self._retry_hint(job_id)
+            if delay is None:
+                delay = next(delays)
+            # Never sleep past the deadline: the last poll lands on it.
+            time.sleep(min(max(0.0, delay - (now - requested_at)), deadline - now))
+
+
+# (base_url, api_key) -> [pooled HTTP client, number of open Clients using it].
+# Short scripts that create several clients reuse one warm connection, and
+# the pool is closed once its last Client is closed.
+_http_clients: dict[tuple[str, str], list[Any]] = {}
+_http_clients_lock = threading.Lock()
+
+
+def _acquire_http_client(base_url: str, api_key: str) -> httpx.Client:
+    """Return the shared HTTP/2 client for a server and API key.
+
+    Idle connections are kept for 15 s, below common proxy idle timeouts.
+    No transport is passed explicitly so httpx still honours the proxy
+    environment variables. Each call must be paired with
+    ``_release_http_client``.
+    """
+    key = (base_url, api_key)
+    with _http_clients_lock:
+        entry = _http_clients.get(key)
+        if entry is None or entry[0].is_closed:
+            client = httpx.Client(
+                headers={"Authorization": f"Bearer {api_key}"},
+                timeout=httpx.Timeout(30.0, connect=10.0),
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=15.0),
+            )
+            entry = _http_clients[key] = [client, 0]
+        entry[1] += 1
+        pooled: httpx.Client = entry[0]
+        return pooled
+
+
+def _release_http_client(base_url: str, api_key: str) -> None:
+    """Drop one reference to a shared client, closing it when unused."""
+    key = (base_url, api_key)
+    with _http_clients_lock:
+        entry = _http_clients.get(key)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del _http_clients[key]
+    entry[0].close()
+
+
+@atexit.register
+def _close_http_clients() -> None:
+    with _http_clients_lock:
+        entries = list(_http_clients.values())
+        _http_clients.clear()
+    for client, _ in entries:
+        client.close()
 
 
 def _check(resp: httpx.Response) -> None:
@@ -276,7 +632,7 @@ def _check(resp: httpx.Response) -> None:
     if resp.is_success:
         return
     try:
-        data: dict[str, Any] = resp.json()
+        data: dict[str, Any] = _json_loads(resp.content)
         detail = data.get("detail")
         if detail:
             raise BiocomputeError(str(detail))
@@ -287,9 +643,48 @@ def _check(resp: httpx.Response) -> None:
         raise BiocomputeError(resp.text) from None
 
 
+def _response_json(resp: httpx.Response) -> Any:
+    """Check a response for errors and decode its JSON body."""
+    _check(resp)
+    return _json_loads(resp.content)
+
+
+def _trace_experiments(fn: Callable[[], None]) -> list[list[dict[str, Any]]]:
+    """Trace an experiment function and serialize it for the job server."""
+    from biocompute.trace import collect_trace
+
+    trace = collect_trace(fn)
+    if not trace.ops:
+        raise BiocomputeError(
+            "Experiment has no operations. Call well.fill(), well.mix(), etc. in the experiment function."
+        )
+    return _to_experiments(trace.ops)
+
+
+# Largest well index bucketed through a dense list; anything beyond falls
+# back to a dict so a stray huge index can't allocate a giant list.
+_DENSE_WELL_LIMIT = 4096
+
+
 def _to_experiments(ops: list[TracedOp]) -> list[list[dict[str, Any]]]:
-    """Group traced ops by well into experiments for the job server."""
-    by_well: dict[int, list[dict[str, Any]]] = defaultdict(list)
+    """Group traced ops by well into experiments for the job server.
+
+    Well indices are normally small and dense, so ops are bucketed straight
+    into a list indexed by well; wells without ops are left out. Anything
+    outside that range (huge or negative) goes through a dict instead.
+    """
+    from biocompute.ops import op_to_dict
+
+    if any(not 0 <= traced.op.well_idx < _DENSE_WELL_LIMIT for traced in ops):
+        sparse: dict[int, list[dict[str, Any]]] = {}
+        for traced in ops:
+            sparse.setdefault(traced.op.well_idx, []).append(op_to_dict(traced.op))
+        return [sparse[i] for i in sorted(sparse)]
+
+    by_well: list[list[dict[str, Any]]] = []
     for traced in ops:
-        by_well[traced.op.well_idx].append(op_to_dict(traced.op))
-    return [by_well[i] for i in sorted(by_well)]
+        idx = traced.op.well_idx
+        if idx >= len(by_well):
+            by_well.extend([] for _ in range(idx + 1 - len(by_well)))
+        by_well[idx].append(op_to_dict(traced.op))
+    return [experiment for experiment in by_well if experiment]
@@ -7,13 +7,13 @@ and sent to the competition server.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
     from biocompute.reagent import Reagent
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FillOp:
     """Fill a well with a reagent."""
 
@@ -22,14 +22,14 @@ class FillOp:
     volume_ul: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MixOp:
     """Mix contents of a well."""
 
     well_idx: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImageOp:
     """Capture an image of a well."""
 
@@ -39,12 +39,46 @@ class ImageOp:
 Op = FillOp | MixOp | ImageOp
 
 
+# Per-type templates: copying a small dict and filling in the varying
+# values is cheaper than building a fresh literal for every op.
+_FILL_TEMPLATE: dict[str, str | float] = {"op": "fill", "reagent": "", "volume": 0.0}
+_MIX_TEMPLATE: dict[str, str | float] = {"op": "mix"}
+_IMAGE_TEMPLATE: dict[str, str | float] = {"op": "image"}
+
+
+def _fill_to_dict(op: FillOp) -> dict[str, str | float]:
+    d = _FILL_TEMPLATE.copy()
+    d["reagent"] = op.reagent.name
+    d["volume"] = op.volume_ul
+    return d
+
+
+def _mix_to_dict(op: MixOp) -> dict[str, str | float]:
+    return _MIX_TEMPLATE.copy()
+
+
+def _image_to_dict(op: ImageOp) -> dict[str, str | float]:
+    return _IMAGE_TEMPLATE.copy()
+
+
+# Exact op type -> serializer; one dict lookup per op instead of an
+# isinstance chain on the submission hot path.
+_SERIALIZERS: dict[type[Any], Callable[[Any], dict[str, str | float]]] = {
+    FillOp: _fill_to_dict,
+    MixOp: _mix_to_dict,
+    ImageOp: _image_to_dict,
+}
+
+
 def op_to_dict(op: Op) -> dict[str, str | float]:
     """Serialize an operation to a JSON-compatible dict."""
-    if isinstance(op, FillOp):
-        return {"op": "fill", "reagent": op.reagent.name, "volume": op.volume_ul}
-    elif isinstance(op, MixOp):
-        return {"op": "mix"}
-    elif isinstance(op, ImageOp):
-        return {"op": "image"}
-    raise ValueError(f"Unknown op type: {op}")  # pragma: no cover
+    serialize = _SERIALIZERS.get(type(op))
+    if serialize is None:
+        # Subclasses of the op types serialize like their base.
+        for base in type(op).__mro__[1:]:
+            serialize = _SERIALIZERS.get(base)
+            if serialize is not None:
+                break
+        else:
+            raise ValueError(f"Unknown op type: {op}")
+    return serialize(op)
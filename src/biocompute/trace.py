@@ -39,7 +39,7 @@ def collect_trace(fn: Callable[[], None]) -> Trace:
     return trace
 
 
-@dataclass
+@dataclass(slots=True)
 class TracedOp:
     """An operation wrapped with a unique ID assigned during tracing.
 
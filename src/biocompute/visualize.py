@@ -12,12 +12,16 @@ import re
 import sys
 from collections import defaultdict
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 ROWS = "ABCDEFGH"
 COLS = 12
 WELLS_PER_PLATE = 96
 
+# "A1", "A2", ... "H12" in plate order, so hot loops index instead of formatting.
+_WELL_LABELS: tuple[str, ...] = tuple(f"{r}{c}" for r in ROWS for c in range(1, COLS + 1))
+
 # ── Reagent colours ──────────────────────────────────────────────
 
 _COLORS: dict[str, str] = {
@@ -34,6 +38,7 @@ _COLORS: dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=256)
 def _reagent_color(name: str) -> str:
     if name in _COLORS:
         return _COLORS[name]
@@ -42,6 +47,12 @@ def _reagent_color(name: str) -> str:
     return f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}"
 
 
+@lru_cache(maxsize=256)
+def _reagent_rgb(name: str) -> tuple[int, int, int]:
+    c = _reagent_color(name)
+    return int(c[1:3], 16), int(c[3:5], 16), int(c[5:7], 16)
+
+
 def _blend_colors(fills: list[tuple[str, float]]) -> str:
     if not fills:
         return "#f0f0f0"
@@ -50,10 +61,10 @@ def _blend_colors(fills: list[tuple[str, float]]) -> str:
         return "#f0f0f0"
     r = g = b = 0.0
     for name, vol in fills:
-        c = _reagent_color(name)
-        r += int(c[1:3], 16) * vol / total
-        g += int(c[3:5], 16) * vol / total
-        b += int(c[5:7], 16) * vol / total
+        cr, cg, cb = _reagent_rgb(name)
+        r += cr * vol / total
+        g += cg * vol / total
+        b += cb * vol / total
     return f"#{int(r):02x}{int(g):02x}{int(b):02x}"
 
 
@@ -62,11 +73,8 @@ def _blend_colors(fills: list[tuple[str, float]]) -> str:
 
 def _well_label(well_idx: int) -> tuple[int, str]:
     """Return (plate_id, 'A1'-style label) for an abstract well index."""
-    plate_id = well_idx // WELLS_PER_PLATE
-    plate_well = well_idx % WELLS_PER_PLATE
-    row = plate_well // 12
-    col = plate_well % 12
-    return plate_id, f"{chr(65 + row)}{col + 1}"
+    plate_id, plate_well = divmod(well_idx, WELLS_PER_PLATE)
+    return plate_id, _WELL_LABELS[plate_well]
 
 
 def _sort_well_labels(labels: list[str]) -> list[str]:
@@ -223,15 +231,22 @@ _WELL_MIXED = "\u229b"  # ⊛ circled asterisk
 _WELL_EMPTY = "\u25cb"  # ○ empty circle
 
 
+@lru_cache(maxsize=256)
+def _color_style(color: str) -> Any:
+    """Rich Style for a hex colour, built once and shared by every well using it."""
+    from rich.style import Style
+
+    return Style(color=color)
+
+
 def _well_cell(w: dict[str, Any] | None) -> Any:
     """Return a Rich Text for a single well cell."""
-    from rich.style import Style
     from rich.text import Text
 
     if w:
         color = w.get("color", "#f0f0f0")
         char = _WELL_MIXED if w.get("mixed") else _WELL_FILLED
-        return Text(f" {char}", style=Style(color=color))
+        return Text(f" {char}", style=_color_style(color))
     return Text(f" {_WELL_EMPTY}", style="dim")
 
 
@@ -246,24 +261,22 @@ def _build_plate_table(plate: dict[str, Any]) -> Any:
         table.add_column(str(c), justify="center", width=2)
 
     wells: dict[str, Any] = plate.get("wells", {})
-    for r_idx in range(8):
-        rl = ROWS[r_idx]
+    for r_idx, rl in enumerate(ROWS):
         cells: list[Text] = [Text(rl, style="dim")]
-        for c in range(1, COLS + 1):
-            cells.append(_well_cell(wells.get(f"{rl}{c}")))
+        for label in _WELL_LABELS[r_idx * COLS : (r_idx + 1) * COLS]:
+            cells.append(_well_cell(wells.get(label)))
         table.add_row(*cells)
     return table
 
 
 def _build_legend_text(legend: dict[str, str]) -> Any:
-    from rich.style import Style
     from rich.text import Text
 
     text = Text()
     for i, (name, color) in enumerate(legend.items()):
         if i > 0:
             text.append("  ")
-        text.append(f" {_WELL_FILLED}", style=Style(color=color))
+        text.append(f" {_WELL_FILLED}", style=_color_style(color))
         text.append(f" {name}")
     return text
 
@@ -293,17 +306,20 @@ def _render_all(experiments: list[dict[str, Any]]) -> None:
             header.append(f"Step {idx + 1} of {len(slides)}", style="dim")
             header.append("  ")
             header.append(step_title, style="bold")
-            console.print(header)
-            console.print()
 
-            for pi, plate in enumerate(slide.get("plates", [])):
-                label = plate.get("label", f"Plate {pi + 1}")
-                console.print(f"  [dim]{label}[/dim]")
-                console.print(_build_plate_table(plate))
+            # Buffer the whole slide so it reaches the terminal in one write.
+            with console:
+                console.print(header)
                 console.print()
 
-            console.print(_build_legend_text(legend))
-            console.print()
+                for pi, plate in enumerate(slide.get("plates", [])):
+                    label = plate.get("label", f"Plate {pi + 1}")
+                    console.print(f"  [dim]{label}[/dim]")
+                    console.print(_build_plate_table(plate))
+                    console.print()
+
+                console.print(_build_legend_text(legend))
+                console.print()
 
 
 # ── Textual TUI (interactive mode) ───────────────────────────────
@@ -351,6 +367,8 @@ def _run_textual_app(experiments: list[dict[str, Any]]) -> None:
             self._experiments = experiments
             self._current_exp = 0
             self._current_step = 0
+            # (experiment, step) -> plates renderable; slides never change.
+            self._plate_views: dict[tuple[int, int], Any] = {}
 
         def compose(self) -> ComposeResult:
             yield Static("", id="experiment-title")
@@ -385,6 +403,14 @@ def _run_textual_app(experiments: list[dict[str, Any]]) -> None:
             )
             self.query_one("#step-title", Static).update(slide.get("title", ""))
 
+            key = (self._current_exp, step)
+            view = self._plate_views.get(key)
+            if view is None:
+                view = self._plate_views[key] = self._build_plates(slide)
+            self.query_one("#plates-container", Static).update(view)
+            self.query_one("#legend", Static).update(_build_legend_text(legend))
+
+        def _build_plates(self, slide: dict[str, Any]) -> Any:
             from rich.console import Group, RenderableType
             from rich.text import Text
 
@@ -394,11 +420,7 @@ def _run_textual_app(experiments: list[dict[str, Any]]) -> None:
                 parts.append(Text(label, style="dim"))
                 parts.append(_build_plate_table(plate))
                 parts.append(Text(""))
-
-            self.query_one("#plates-container", Static).update(
-                Group(*parts) if parts else ""
-            )
-            self.query_one("#legend", Static).update(_build_legend_text(legend))
+            return Group(*parts) if parts else ""
 
         def action_next_slide(self) -> None:
             slides = self._cur_slides()
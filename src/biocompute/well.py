@@ -18,6 +18,8 @@ class Well:
     the trace.
     """
 
+    __slots__ = ("_idx", "_trace")
+
     def __init__(self, idx: int, trace: Trace) -> None:
         self._idx = idx
         self._trace = trace
@@ -0,0 +1,147 @@
+"""Tests for CLI helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+from click.testing import CliRunner
+from pytest_httpx import HTTPXMock
+
+from biocompute import cli
+from biocompute.cli import _find_experiments, _poll_with_status
+from biocompute.client import Client
+from biocompute.exceptions import BiocomputeError
+
+
+class TestFindExperiments:
+    """Tests for experiment discovery in user scripts."""
+
+    def test_definition_order(self, tmp_path: Path) -> None:
+        script = tmp_path / "exp.py"
+        script.write_text("def experiment_b():\n    pass\n\ndef helper():\n    pass\n\ndef experiment_a():\n    pass\n")
+        assert [name for name, _ in _find_experiments(script)] == ["experiment_b", "experiment_a"]
+
+    def test_factory_made_experiments(self, tmp_path: Path) -> None:
+        script = tmp_path / "exp.py"
+        script.write_text(
+            "def _make(volume):\n"
+            "    def run():\n"
+            "        pass\n"
+            "    return run\n"
+            "\n"
+            "experiment_low = _make(10.0)\n"
+            "experiment_high = _make(50.0)\n"
+            "\n"
+            "def experiment_plain():\n"
+            "    pass\n"
+        )
+        assert [name for name, _ in _find_experiments(script)] == [
+            "experiment_low",
+            "experiment_high",
+            "experiment_plain",
+        ]
+
+    def test_experiments_bound_through_globals(self, tmp_path: Path) -> None:
+        script = tmp_path / "exp.py"
+        script.write_text(
+            "def _make(volume):\n"
+            "    def run():\n"
+            "        pass\n"
+            "    return run\n"
+            "\n"
+            "for v in (10, 20):\n"
+            '    globals()[f"experiment_{v}"] = _make(v)\n'
+        )
+        assert [name for name, _ in _find_experiments(script)] == ["experiment_10", "experiment_20"]
+
+    def test_script_without_experiments_is_not_executed(self, tmp_path: Path) -> None:
+        script = tmp_path / "exp.py"
+        script.write_text("raise RuntimeError('executed')\n")
+        assert _find_experiments(script) == []
+
+    def test_reloads_after_edit(self, tmp_path: Path) -> None:
+        script = tmp_path / "exp.py"
+        script.write_text("def experiment_one():\n    pass\n")
+        assert [name for name, _ in _find_experiments(script)] == ["experiment_one"]
+        script.write_text("def experiment_one():\n    pass\n\ndef experiment_two():\n    pass\n")
+        assert [name for name, _ in _find_experiments(script)] == ["experiment_one", "experiment_two"]
+
+
+class TestSubmitCommand:
+    """Tests for the submit command."""
+
+    def test_reports_created_job_when_later_post_fails(
+        self, tmp_path: Path, httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        script = tmp_path / "exp.py"
+        script.write_text(
+            "from biocompute import wells, red_dye\n"
+            "\n"
+            "def experiment_a():\n"
+            "    for w in wells(count=1):\n"
+            "        w.fill(10.0, red_dye)\n"
+            "\n"
+            "def experiment_b():\n"
+            "    for w in wells(count=1):\n"
+            "        w.fill(20.0, red_dye)\n"
+        )
+        url = "http://test:9999/api/v1/jobs"
+        httpx_mock.add_response(url=url, method="POST", json={"id": "job-a"})
+        httpx_mock.add_response(url=url, method="POST", status_code=500, json={"detail": "boom"})
+        monkeypatch.setattr(cli, "_get_client", lambda: Client(api_key="sk", base_url="http://test:9999"))
+
+        result = CliRunner().invoke(cli.cli, ["submit", str(script)])
+        assert result.exit_code == 1
+        assert "job-a" in result.output
+        assert "boom" in result.output
+
+
+class _FakeClient:
+    """Stands in for Client, returning a fixed sequence of job statuses."""
+
+    _timeout = 30.0
+
+    def __init__(self, statuses: list[str], delay: float = 0.0) -> None:
+        self._statuses = statuses
+        self._delay = delay
+
+    def get_job(self, job_id: str) -> dict[str, Any]:
+        return {"id": job_id, "status": self._statuses.pop(0)}
+
+    def _retry_hint(self, job_id: str) -> float | None:
+        return None
+
+    def _poll_delays(self) -> Iterator[float]:
+        while True:
+            yield self._delay
+
+
+class TestPollWithStatus:
+    """Tests for the CLI follow loop."""
+
+    def test_no_spinner_when_not_a_tty(
+        self, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(cli.time, "sleep", lambda _: None)
+        client = _FakeClient(["queued", "running", "complete"])
+
+        result = _poll_with_status(client, "job-1", "experiment")  # type: ignore[arg-type]
+
+        assert result.status == "complete"
+        out = capsys.readouterr().out
+        assert "\r" not in out
+        assert "Waiting in queue" in out
+        assert "completed" in out
+
+    def test_last_poll_lands_on_timeout(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        clock = [1000.0]
+        monkeypatch.setattr(cli.time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(cli.time, "sleep", lambda s: clock.__setitem__(0, clock[0] + s))
+        client = _FakeClient(["running"] * 100, delay=20.0)
+
+        with pytest.raises(BiocomputeError, match="did not complete"):
+            _poll_with_status(client, "job-1", "experiment")  # type: ignore[arg-type]
+
+        assert clock[0] == pytest.approx(1000.0 + client._timeout)
@@ -3,15 +3,32 @@
 from __future__ import annotations
 
 import base64
+import json
+import threading
+import time
 from pathlib import Path
 from typing import Any
 
+import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
-from biocompute.client import Client, SubmissionResult
+from biocompute.client import (
+    LEADERBOARD_TTL,
+    POLL_BACKOFF_FACTOR,
+    POLL_BASE_DELAY,
+    POLL_MAX_DELAY,
+    Client,
+    SubmissionResult,
+    _iter_job_body,
+    _parse_retry_after,
+    _poll_delays,
+    _to_experiments,
+)
 from biocompute.exceptions import BiocomputeError
+from biocompute.ops import FillOp, ImageOp, MixOp
 from biocompute.reagent import red_dye
+from biocompute.trace import Trace
 from biocompute.well import wells
 
 
@@ -38,10 +55,86 @@ class TestClient:
             client.submit(empty)
         client.close()
 
+    def test_config_round_trip(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        from biocompute import client as client_mod
+
+        monkeypatch.setattr(client_mod, "CONFIG_FILE", tmp_path / "config.toml")
+        config = {"api_key": 'sk_"quoted"\\key\U0001f600\x7f\t', "base_url": "http://localhost:9999"}
+        client_mod.save_config(config)
+        assert client_mod._load_config() == config
+
+    def test_config_reparsed_when_file_changes(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        from biocompute import client as client_mod
+
+        config_file = tmp_path / "config.toml"
+        monkeypatch.setattr(client_mod, "CONFIG_FILE", config_file)
+        config_file.write_text('api_key = "sk_one"\n')
+        assert client_mod._load_config() == {"api_key": "sk_one"}
+        config_file.write_text('api_key = "sk_second"\n')
+        assert client_mod._load_config() == {"api_key": "sk_second"}
+
+    def test_legacy_unescaped_config(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        from biocompute import client as client_mod
+
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('api_key = "sk_\\q"\nbase_url = "http://localhost:9999"\n')
+        monkeypatch.setattr(client_mod, "CONFIG_FILE", config_file)
+        assert client_mod._load_config() == {"api_key": "sk_\\q", "base_url": "http://localhost:9999"}
+
     def test_context_manager(self) -> None:
         with Client(api_key="sk_test", base_url="http://localhost:9999") as client:
             assert client._api_key == "sk_test"
 
+    def test_shares_http_client_per_credentials(self) -> None:
+        with (
+            Client(api_key="sk_test", base_url="http://localhost:9999") as a,
+            Client(api_key="sk_test", base_url="http://localhost:9999") as b,
+            Client(api_key="sk_other", base_url="http://localhost:9999") as c,
+        ):
+            assert a._client is b._client
+            assert a._client is not c._client
+
+    def test_close_releases_unused_http_client(self) -> None:
+        from biocompute import client as client_mod
+
+        a = Client(api_key="sk_release", base_url="http://localhost:9999")
+        b = Client(api_key="sk_release", base_url="http://localhost:9999")
+        shared = a._client
+        a.close()
+        a.close()
+        assert not shared.is_closed
+        b.close()
+        assert shared.is_closed
+        assert ("http://localhost:9999", "sk_release") not in client_mod._http_clients
+
+    def test_prewarm_sends_head(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url="http://prewarm:9999", method="HEAD")
+
+        with Client(api_key="sk_prewarm", base_url="http://prewarm:9999", prewarm=True) as client:
+            assert client._prewarm_thread is not None
+            client._prewarm_thread.join(timeout=5.0)
+        assert [r.method for r in httpx_mock.get_requests()] == ["HEAD"]
+
+    def test_prewarm_failure_is_ignored(self, httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch) -> None:
+        errors: list[BaseException | None] = []
+        monkeypatch.setattr(threading, "excepthook", lambda args: errors.append(args.exc_value))
+        httpx_mock.add_exception(httpx.ConnectError("unreachable"))
+
+        with Client(api_key="sk_prewarm", base_url="http://prewarm:9999", prewarm=True) as client:
+            assert client._prewarm_thread is not None
+            client._prewarm_thread.join(timeout=5.0)
+        assert errors == []
+
+    def test_prewarm_after_close_is_ignored(self) -> None:
+        client = Client(api_key="sk_prewarm_closed", base_url="http://prewarm:9999")
+        client.close()
+        client._prewarm()
+
+    def test_http_client_honours_proxy_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+        with Client(api_key="sk_proxy", base_url="https://proxied.example") as client:
+            assert client._client._mounts
+
 
 def _experiment() -> None:
     """A minimal experiment for testing."""
@@ -68,6 +161,268 @@ class TestSubmit:
         assert len(httpx_mock.get_requests()) == 2
         client.close()
 
+    def test_skips_poll_when_post_returns_result(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url="http://test:9999/api/v1/jobs", json=_job_response(job_id="j1"), method="POST")
+
+        with Client(api_key="sk", base_url="http://test:9999") as client:
+            result = client.submit(_experiment)
+        assert result.status == "complete"
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_posts_experiments_as_json(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url="http://test:9999/api/v1/jobs", json={"id": "j1"}, method="POST")
+
+        with Client(api_key="sk", base_url="http://test:9999") as client:
+            client.submit_async(_experiment)
+        request = httpx_mock.get_request(method="POST")
+        assert request is not None
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content) == {
+            "experiments": [[{"op": "fill", "reagent": "red_dye", "volume": 50.0}]],
+        }
+
+    def test_long_poll_sends_wait(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url="http://test:9999/api/v1/jobs", json={"id": "j1"}, method="POST")
+        httpx_mock.add_response(url="http://test:9999/api/v1/jobs/j1?wait=25.0", json=_job_response(job_id="j1"))
+
+        with Client(api_key="sk", base_url="http://test:9999", long_poll=25.0) as client:
+            result = client.submit(_experiment)
+        assert result.status == "complete"
+
+
+class TestGetJob:
+    """Tests for conditional job status requests."""
+
+    def test_revalidates_with_etag(self, httpx_mock: HTTPXMock) -> None:
+        running = _job_response(job_id="j1", status="running")
+        httpx_mock.add_response(url="http://test:9999/api/v1/jobs/j1", json=running, headers={"ETag": '"v1"'})
+        httpx_mock.add_response(
+            url="http://test:9999/api/v1/jobs/j1",
+            status_code=304,
+            match_headers={"If-None-Match": '"v1"'},
+        )
+
+        with Client(api_key="sk", base_url="http://test:9999") as client:
+            assert client.get_job("j1") == running
+            assert client.get_job("j1") == running
+
+    def test_finished_job_not_revalidated(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            url="http://test:9999/api/v1/jobs/j1",
+            json=_job_response(job_id="j1"),
+            headers={"ETag": '"v2"'},
+            is_reusable=True,
+        )
+
+        with Client(api_key="sk", base_url="http://test:9999") as client:
+            client.get_job("j1")
+            client.get_job("j1")
+        assert all("If-None-Match" not in r.headers for r in httpx_mock.get_requests())
+
+    def test_retry_after_hint_clamped(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            url="http://test:9999/api/v1/jobs/j1",
+            json=_job_response(job_id="j1", status="running"),
+            headers={"Retry-After": "120"},
+        )
+
+        with Client(api_key="sk", base_url="http://test:9999") as client:
+            client.get_job("j1")
+            assert client._retry_hint("j1") == client._poll_max_delay
+            assert client._retry_hint("j1") is None
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After parsing."""
+
+    def test_seconds(self) -> None:
+        assert _parse_retry_after("3") == 3.0
+        assert _parse_retry_after(1.5) == 1.5
+
+    def test_http_date_in_past(self) -> None:
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_invalid(self) -> None:
+        assert _parse_retry_after("soon") is None
+        assert _parse_retry_after(None) is None
+
+
+class TestSubmitMany:
+    """Tests for Client.submit_async_many()."""
+
+    def test_posts_one_job_per_experiment(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url="http://test:9999/api/v1/jobs", json={"id": "j1"}, method="POST")
+        httpx_mock.add_response(url="http://test:9999/api/v1/jobs", json={"id": "j2"}, method="POST")
+
+        with Client(api_key="sk", base_url="http://test:9999") as client:
+            jobs = client.submit_async_many([_experiment, _experiment])
+        assert [j["id"] for j in jobs] == ["j1", "j2"]
+
+    def test_submit_many_waits_for_all(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url="http://test:9999/api/v1/jobs", json={"id": "j1"}, method="POST")
+        httpx_mock.add_response(url="http://test:9999/api/v1/jobs", json={"id": "j2"}, method="POST")
+        httpx_mock.add_response(url="http://test:9999/api/v1/jobs/j1", json=_job_response(job_id="j1"))
+        httpx_mock.add_response(url="http://test:9999/api/v1/jobs/j2", json=_job_response(job_id="j2", status="failed"))
+
+        with Client(api_key="sk", base_url="http://test:9999") as client:
+            results = client.submit_many([_experiment, _experiment])
+        assert [(r.job_id, r.status) for r in results] == [("j1", "complete"), ("j2", "failed")]
+
+    def test_empty_experiment_fails_before_posting(self, httpx_mock: HTTPXMock) -> None:
+        def empty() -> None:
+            pass
+
+        with Client(api_key="sk", base_url="http://test:9999") as client:
+            with pytest.raises(BiocomputeError, match="no operations"):
+                client.submit_async_many([_experiment, empty])
+        assert httpx_mock.get_requests() == []
+
+
+class TestEnrollment:
+    """Tests for enrollment caching."""
+
+    def test_leaderboard_reuses_enrollment(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url="http://test:9999/api/v1/user/enrollment", json={"challenge_id": "c1"})
+        httpx_mock.add_response(
+            url="http://test:9999/api/v1/challenges/c1/leaderboard",
+            json={"entries": []},
+            is_reusable=True,
+        )
+
+        with Client(api_key="sk", base_url="http://test:9999") as client:
+            client.leaderboard()
+            client.leaderboard()
+        assert len(httpx_mock.get_requests(url="http://test:9999/api/v1/user/enrollment")) == 1
+
+    def test_target_bytes(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            url="http://test:9999/api/v1/user/enrollment",
+            json={"challenge_id": "c1", "target_image_base64": base64.b64encode(b"png").decode()},
+        )
+
+        with Client(api_key="sk", base_url="http://test:9999") as client:
+            assert client.target_bytes() == b"png"
+
+    def test_stale_enrollment_dropped_on_error(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url="http://test:9999/api/v1/user/enrollment", json={"challenge_id": "c1"})
+        httpx_mock.add_response(
+            url="http://test:9999/api/v1/challenges/c1/leaderboard",
+            status_code=404,
+            json={"detail": "Challenge not found"},
+        )
+
+        with Client(api_key="sk", base_url="http://test:9999") as client:
+            with pytest.raises(BiocomputeError, match="Challenge not found"):
+                client.leaderboard()
+            assert client._enrollment is None
+
+    def test_leaderboard_revalidated_with_etag(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url="http://test:9999/api/v1/user/enrollment", json={"challenge_id": "c1"})
+        url = "http://test:9999/api/v1/challenges/c1/leaderboard"
+        httpx_mock.add_response(url=url, json={"entries": [{"rank": 1}]}, headers={"ETag": '"v1"'})
+        httpx_mock.add_response(url=url, status_code=304, match_headers={"If-None-Match": '"v1"'})
+
+        with Client(api_key="sk", base_url="http://test:9999") as client:
+            assert client.leaderboard() == [{"rank": 1}]
+            assert client.leaderboard() == [{"rank": 1}]
+            assert len(httpx_mock.get_requests(url=url)) == 1
+            assert client._leaderboard is not None
+            client._leaderboard = (time.monotonic() - LEADERBOARD_TTL, *client._leaderboard[1:])
+            assert client.leaderboard() == [{"rank": 1}]
+        assert len(httpx_mock.get_requests(url=url)) == 2
+
+
+class TestToExperiments:
+    """Tests for grouping traced ops into per-well experiments."""
+
+    def test_groups_by_well_in_index_order(self) -> None:
+        trace = Trace()
+        trace.emit(FillOp(well_idx=2, reagent=red_dye, volume_ul=10.0))
+        trace.emit(FillOp(well_idx=0, reagent=red_dye, volume_ul=20.0))
+        trace.emit(MixOp(well_idx=2))
+
+        assert _to_experiments(trace.ops) == [
+            [{"op": "fill", "reagent": "red_dye", "volume": 20.0}],
+            [{"op": "fill", "reagent": "red_dye", "volume": 10.0}, {"op": "mix"}],
+        ]
+
+    def test_empty(self) -> None:
+        assert _to_experiments([]) == []
+
+    def test_sparse_high_indices(self) -> None:
+        trace = Trace()
+        trace.emit(MixOp(well_idx=10**9))
+        trace.emit(MixOp(well_idx=3))
+        assert _to_experiments(trace.ops) == [[{"op": "mix"}], [{"op": "mix"}]]
+
+        trace = Trace()
+        trace.emit(ImageOp(well_idx=0))
+        trace.emit(MixOp(well_idx=-1))
+        assert _to_experiments(trace.ops) == [[{"op": "mix"}], [{"op": "image"}]]
+
+        trace = Trace()
+        trace.emit(MixOp(well_idx=-1))
+        assert _to_experiments(trace.ops) == [[{"op": "mix"}]]
+
+    def test_streamed_body_is_valid_json(self) -> None:
+        experiments: list[list[dict[str, Any]]] = [[{"op": "mix"}], [{"op": "image"}, {"op": "mix"}]]
+        assert json.loads(b"".join(_iter_job_body(experiments))) == {"experiments": experiments}
+        assert json.loads(b"".join(_iter_job_body([]))) == {"experiments": []}
+
+
+class TestPollDelay:
+    """Tests for the jittered poll backoff schedule."""
+
+    def test_first_delay_around_base(self) -> None:
+        for _ in range(50):
+            first = next(_poll_delays(POLL_BASE_DELAY, POLL_BACKOFF_FACTOR, POLL_MAX_DELAY))
+            assert 0.5 * POLL_BASE_DELAY <= first <= 1.5 * POLL_BASE_DELAY
+
+    def test_capped(self) -> None:
+        delays = _poll_delays(POLL_BASE_DELAY, POLL_BACKOFF_FACTOR, POLL_MAX_DELAY)
+        for _ in range(100):
+            assert next(delays) <= 1.5 * POLL_MAX_DELAY
+
+    def test_defaults_reach_cap_quickly(self) -> None:
+        delays = _poll_delays(POLL_BASE_DELAY, POLL_BACKOFF_FACTOR, POLL_MAX_DELAY)
+        schedule = [next(delays) for _ in range(20)]
+        assert POLL_MAX_DELAY <= 3.0
+        assert sum(schedule[:10]) < 20.0
+        assert all(d >= 0.5 * POLL_MAX_DELAY for d in schedule[-5:])
+
+    def test_client_settings(self) -> None:
+        with Client(
+            api_key="sk", base_url="http://test:9999", poll_delay=1.0, poll_backoff=2.0, poll_max_delay=5.0
+        ) as client:
+            delays = client._poll_delays()
+        assert 0.5 <= next(delays) <= 1.5
+        for _ in range(20):
+            assert next(delays) <= 7.5
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"poll_delay": 0.0}, {"poll_backoff": 0.5}, {"poll_delay": 2.0, "poll_max_delay": 1.0}],
+    )
+    def test_rejects_invalid_settings(self, kwargs: dict[str, float]) -> None:
+        with pytest.raises(ValueError, match="poll_"):
+            Client(api_key="sk", base_url="http://test:9999", **kwargs)
+
+    def test_sleep_clipped_to_timeout(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            url="http://test:9999/api/v1/jobs/j1",
+            json=_job_response(job_id="j1", status="running"),
+            is_reusable=True,
+        )
+
+        with Client(
+            api_key="sk", base_url="http://test:9999", timeout=0.2, poll_delay=5.0, poll_max_delay=5.0
+        ) as client:
+            start = time.monotonic()
+            with pytest.raises(BiocomputeError, match="did not complete"):
+                client._poll("j1")
+        assert time.monotonic() - start < 2.0
+        assert len(httpx_mock.get_requests()) == 2
+
 
 # Minimal valid 1x1 white PNG
 _TINY_PNG = (
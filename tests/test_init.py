@@ -0,0 +1,46 @@
+"""Tests for the package's lazy top-level exports.
+
+Import-time behaviour is checked in a fresh interpreter, since the test
+session has already imported everything.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import biocompute
+
+
+def _run(code: str) -> None:
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestLazyExports:
+    """Tests for biocompute.__getattr__."""
+
+    def test_import_does_not_load_httpx(self) -> None:
+        _run("import sys, biocompute; assert 'httpx' not in sys.modules, 'httpx loaded eagerly'")
+
+    def test_exports_resolve(self) -> None:
+        _run(
+            "import biocompute, biocompute.client as c, biocompute.well as w\n"
+            "assert biocompute.Client is c.Client\n"
+            "assert biocompute.wells is w.wells\n"
+            "for name in biocompute.__all__:\n"
+            "    getattr(biocompute, name)\n"
+        )
+
+    def test_submodules_resolve_as_attributes(self) -> None:
+        _run(
+            "import biocompute\n"
+            "assert biocompute.client.Client is biocompute.Client\n"
+            "assert biocompute.trace.Trace is biocompute.Trace\n"
+            "assert biocompute.ops.FillOp is biocompute.FillOp\n"
+        )
+
+    def test_unknown_attribute(self) -> None:
+        with pytest.raises(AttributeError, match="no attribute 'nope'"):
+            biocompute.nope  # noqa: B018
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from biocompute.ops import FillOp, ImageOp, MixOp, op_to_dict
 from biocompute.reagent import Reagent, red_dye, water
 
@@ -37,3 +39,7 @@ class TestOpToDict:
         op = FillOp(well_idx=0, reagent=custom, volume_ul=10.0)
         assert op.reagent is custom
         assert op.reagent.name == "custom"
+
+    def test_unknown_op_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Unknown op type"):
+            op_to_dict(object())  # type: ignore[arg-type]